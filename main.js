@@ -1,5 +1,5 @@
 const { app, BrowserWindow, ipcMain, dialog, shell } = require('electron');
-const { spawn, exec } = require('child_process');
+const { spawn, execFile } = require('child_process');
 const { promisify } = require('util');
 const pty = require('node-pty');
 const path = require('path');
@@ -28,22 +28,35 @@ const HOME_CONFIG_DIR = path.join(os.homedir(), '.multiagent-chat');
 const RECENT_WORKSPACES_FILE = path.join(HOME_CONFIG_DIR, 'recent-workspaces.json');
 const HOME_CONFIG_FILE = path.join(HOME_CONFIG_DIR, 'config.yaml');
 const MAX_RECENT_WORKSPACES = 8;
+const OUTPUT_FLUSH_MS = 16;  // Coalesce agent output into one IPC message per frame
+const FILE_CHANGE_DEBOUNCE_MS = 50;  // Quiet period before a watcher re-reads its file
+const CHAT_TAIL_CHECK_BYTES = 64;  // Last bytes of chat.jsonl re-read to validate the read offset
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);  // Runs git directly (no intermediate shell)
 
 let mainWindow;
 let agents = [];
 let config;
+let configCache = null;  // { path, mtimeMs, size, config } - last parsed config file
 let workspacePath;
 let agentCwd;  // Parent directory of workspace - where agents are launched
 let fileWatcher;
 let outboxWatcher;
+let planWatcher;
 let customWorkspacePath = null;
 let customConfigPath = null;  // CLI --config path
 let messageSequence = 0;  // For ordering messages in chat
 let agentColors = {};     // Map of agent name -> color
 let sessionBaseCommit = null;  // Git commit hash at session start for diff baseline
 
+// Incremental reader state for chat.jsonl - only bytes appended since the last read are parsed
+let chatReadState = createChatReadState();
+let chatReadQueue = Promise.resolve();  // Serializes reads so a delta is never consumed twice
+let chatReadHandle = null;  // { handle, ino } - chat.jsonl read handle kept open for the session
+let chatAppendHandle = null;  // { handle, ino } - chat.jsonl append handle kept open for the session
+let chatAppendQueue = Promise.resolve();  // Serializes appends to chat.jsonl
+let chatSelfWriteSize = -1;  // chat.jsonl size right after our own last append
+
 // Parse command-line arguments
 // Usage: npm start /path/to/workspace
 // Or: npm start --workspace /path/to/workspace
@@ -227,6 +240,14 @@ function getCurrentDirectoryInfo() {
   };
 }
 
+// Send an event to the renderer, skipping it if the window is gone
+// (watchers and agent processes can outlive the window during shutdown)
+function sendToRenderer(channel, payload) {
+  if (mainWindow && !mainWindow.isDestroyed()) {
+    mainWindow.webContents.send(channel, payload);
+  }
+}
+
 // Create the browser window
 function createWindow() {
   console.log('Creating window...');
@@ -280,8 +301,19 @@ async function loadConfig(configPath = null) {
       console.log('Loading bundled config from:', fullPath);
     }
 
+    // Reuse the parsed config unless the file has been edited since
+    const stats = await fs.stat(fullPath);
+    // (size too - a same-tick edit on a coarse-timestamp filesystem keeps the mtime)
+    if (configCache && configCache.path === fullPath &&
+        configCache.mtimeMs === stats.mtimeMs && configCache.size === stats.size) {
+      config = configCache.config;
+      console.log('Config unchanged, using cached copy');
+      return config;
+    }
+
     const configFile = await fs.readFile(fullPath, 'utf8');
     config = yaml.parse(configFile);
+    configCache = { path: fullPath, mtimeMs: stats.mtimeMs, size: stats.size, config };
     console.log('Config loaded successfully');
     return config;
   } catch (error) {
@@ -318,6 +350,9 @@ async function setupWorkspace(customPath = null) {
     // Initialize chat.jsonl (empty file - JSONL format)
     const chatPath = path.join(workspacePath, config.chat_file || 'chat.jsonl');
     await fs.writeFile(chatPath, '');
+    resetChatReadState();
+    closeChatReadHandle();
+    closeChatAppendHandle();
 
     // Clear PLAN_FINAL.md if it exists
     const planPath = path.join(workspacePath, config.plan_file || 'PLAN_FINAL.md');
@@ -347,13 +382,13 @@ async function setupWorkspace(customPath = null) {
 
     // Capture git base commit for diff baseline
     try {
-      const { stdout } = await execAsync('git rev-parse HEAD', { cwd: agentCwd });
+      const { stdout } = await execFileAsync('git', ['rev-parse', 'HEAD'], { cwd: agentCwd });
       sessionBaseCommit = stdout.trim();
       console.log('Session base commit:', sessionBaseCommit);
     } catch (error) {
       // Check if it's a git repo with no commits yet
       try {
-        await execAsync('git rev-parse --git-dir', { cwd: agentCwd });
+        await execFileAsync('git', ['rev-parse', '--git-dir'], { cwd: agentCwd });
         // It's a git repo but no commits - use empty tree hash
         sessionBaseCommit = '4b825dc642cb6eb9a060e54bf8d69288fbee4904';
         console.log('Git repo with no commits, using empty tree hash for diff baseline');
@@ -382,8 +417,36 @@ class AgentProcess {
     this.args = agentConfig.args || [];
     this.use_pty = agentConfig.use_pty || false;
     this.index = index;
+    // Outbox path relative to agentCwd (includes workspace folder)
+    this.outboxFile = `${path.basename(workspacePath)}/${config.outbox_dir || 'outbox'}/${this.name.toLowerCase()}.md`;
+    // Trailer appended to every message delivered to this agent
+    this.replyHint = `(Respond via: cat << 'EOF' > ${this.outboxFile})\n`;
     this.process = null;
-    this.outputBuffer = [];
+    this.pendingOutput = '';  // Output not yet sent to the renderer
+    this.flushTimer = null;
+  }
+
+  // Schedule output for the next batched send to the renderer
+  queueOutput(output) {
+    this.pendingOutput += output;
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => this.flushOutput(), OUTPUT_FLUSH_MS);
+    }
+  }
+
+  // Send all output collected since the last flush as a single message
+  flushOutput() {
+    clearTimeout(this.flushTimer);
+    this.flushTimer = null;
+    if (!this.pendingOutput) return;
+
+    const output = this.pendingOutput;
+    this.pendingOutput = '';
+    sendToRenderer('agent-output', {
+      agentName: this.name,
+      output: output,
+      isPty: this.use_pty
+    });
   }
 
   async start(prompt) {
@@ -421,17 +484,9 @@ class AgentProcess {
         }, 100);
 
         // Capture all output from PTY
+        // node-pty already delivers decoded strings
         this.process.onData((data) => {
-          const output = data.toString();
-          this.outputBuffer.push(output);
-
-          if (mainWindow) {
-            mainWindow.webContents.send('agent-output', {
-              agentName: this.name,
-              output: output,
-              isPty: true
-            });
-          }
+          this.queueOutput(data);
         });
 
         // Handle exit - trigger resume if enabled
@@ -468,32 +523,18 @@ class AgentProcess {
 
         console.log(`Process spawned for ${this.name}, PID: ${this.process.pid}`);
 
+        // Decode on the stream so multi-byte characters split across chunks stay intact
+        this.process.stdout.setEncoding('utf8');
+        this.process.stderr.setEncoding('utf8');
+
         // Capture stdout
         this.process.stdout.on('data', (data) => {
-          const output = data.toString();
-          this.outputBuffer.push(output);
-
-          if (mainWindow) {
-            mainWindow.webContents.send('agent-output', {
-              agentName: this.name,
-              output: output,
-              isPty: false
-            });
-          }
+          this.queueOutput(data);
         });
 
         // Capture stderr
         this.process.stderr.on('data', (data) => {
-          const output = data.toString();
-          this.outputBuffer.push(`[stderr] ${output}`);
-
-          if (mainWindow) {
-            mainWindow.webContents.send('agent-output', {
-              agentName: this.name,
-              output: `[stderr] ${output}`,
-              isPty: false
-            });
-          }
+          this.queueOutput(`[stderr] ${data}`);
         });
 
         // Handle process exit - trigger resume if enabled
@@ -515,13 +556,13 @@ class AgentProcess {
 
   // Handle agent exit
   handleExit(exitCode) {
-    if (mainWindow) {
-      mainWindow.webContents.send('agent-status', {
-        agentName: this.name,
-        status: 'stopped',
-        exitCode: exitCode
-      });
-    }
+    // Deliver any remaining output before the status change
+    this.flushOutput();
+    sendToRenderer('agent-status', {
+      agentName: this.name,
+      status: 'stopped',
+      exitCode: exitCode
+    });
   }
 
   sendMessage(message) {
@@ -568,79 +609,77 @@ function getAgentByName(name) {
 
 // Send a message to all agents EXCEPT the sender
 function sendMessageToOtherAgents(senderName, message) {
-  const workspaceFolder = path.basename(workspacePath);
-  const outboxDir = config.outbox_dir || 'outbox';
+  const sender = senderName.toLowerCase();
+  const recipients = [];
+  // Shared by every recipient - only the reply hint differs per agent
+  const body = `\n---\n📨 MESSAGE FROM ${senderName.toUpperCase()}:\n\n${message}\n\n---\n`;
 
   for (const agent of agents) {
-    if (agent.name.toLowerCase() !== senderName.toLowerCase()) {
-      // Path relative to agentCwd (includes workspace folder)
-      const outboxFile = `${workspaceFolder}/${outboxDir}/${agent.name.toLowerCase()}.md`;
-      const formattedMessage = `\n---\n📨 MESSAGE FROM ${senderName.toUpperCase()}:\n\n${message}\n\n---\n(Respond via: cat << 'EOF' > ${outboxFile})\n`;
-
-      console.log(`Delivering message from ${senderName} to ${agent.name}`);
-      agent.sendMessage(formattedMessage);
+    if (agent.name.toLowerCase() !== sender) {
+      agent.sendMessage(body + agent.replyHint);
+      recipients.push(agent.name);
     }
   }
+
+  if (recipients.length > 0) {
+    console.log(`Delivered message from ${senderName} to ${recipients.join(', ')}`);
+  }
 }
 
 // Send a message to ALL agents (for user messages)
 function sendMessageToAllAgents(message) {
-  const workspaceFolder = path.basename(workspacePath);
-  const outboxDir = config.outbox_dir || 'outbox';
+  // Shared by every recipient - only the reply hint differs per agent
+  const body = `\n---\n📨 MESSAGE FROM USER:\n\n${message}\n\n---\n`;
 
   for (const agent of agents) {
-    // Path relative to agentCwd (includes workspace folder)
-    const outboxFile = `${workspaceFolder}/${outboxDir}/${agent.name.toLowerCase()}.md`;
-    const formattedMessage = `\n---\n📨 MESSAGE FROM USER:\n\n${message}\n\n---\n(Respond via: cat << 'EOF' > ${outboxFile})\n`;
-
-    console.log(`Delivering user message to ${agent.name}`);
-    agent.sendMessage(formattedMessage);
+    agent.sendMessage(body + agent.replyHint);
   }
+
+  console.log(`Delivered user message to ${agents.map(a => a.name).join(', ')}`);
 }
 
-// Build prompt for a specific agent
-function buildAgentPrompt(challenge, agentName) {
+// Fill the session-wide placeholders of the prompt template (same for every agent)
+function buildSessionPrompt(challenge) {
   const workspaceFolder = path.basename(workspacePath);
-  const outboxDir = config.outbox_dir || 'outbox';
-  // Path relative to agentCwd (includes workspace folder)
-  const outboxFile = `${workspaceFolder}/${outboxDir}/${agentName.toLowerCase()}.md`;
   const planFile = `${workspaceFolder}/${config.plan_file || 'PLAN_FINAL.md'}`;
 
   return config.prompt_template
     .replace('{challenge}', challenge)
     .replace('{workspace}', workspacePath)
-    .replace(/{outbox_file}/g, outboxFile)  // Replace all occurrences
     .replace(/{plan_file}/g, planFile)  // Replace all occurrences
-    .replace('{agent_names}', agents.map(a => a.name).join(', '))
-    .replace('{agent_name}', agentName);
+    .replace('{agent_names}', agents.map(a => a.name).join(', '));
+}
+
+// Build prompt for a specific agent from the session prompt
+function buildAgentPrompt(sessionPrompt, agent) {
+  return sessionPrompt
+    .replace(/{outbox_file}/g, agent.outboxFile)  // Replace all occurrences
+    .replace('{agent_name}', agent.name);
 }
 
 // Start all agents with their individual prompts
 async function startAgents(challenge) {
   console.log('Starting agents with prompts...');
+  const sessionPrompt = buildSessionPrompt(challenge);
 
   for (const agent of agents) {
     try {
-      const prompt = buildAgentPrompt(challenge, agent.name);
+      const prompt = buildAgentPrompt(sessionPrompt, agent);
       await agent.start(prompt);
       console.log(`Started agent: ${agent.name}`);
 
-      if (mainWindow) {
-        mainWindow.webContents.send('agent-status', {
-          agentName: agent.name,
-          status: 'running'
-        });
-      }
+      sendToRenderer('agent-status', {
+        agentName: agent.name,
+        status: 'running'
+      });
     } catch (error) {
       console.error(`Failed to start agent ${agent.name}:`, error);
 
-      if (mainWindow) {
-        mainWindow.webContents.send('agent-status', {
-          agentName: agent.name,
-          status: 'error',
-          error: error.message
-        });
-      }
+      sendToRenderer('agent-status', {
+        agentName: agent.name,
+        status: 'error',
+        error: error.message
+      });
     }
   }
 }
@@ -656,24 +695,77 @@ function startFileWatcher() {
 
   // Note: Primary updates happen via 'chat-message' events sent when outbox is processed
   // This watcher is a backup for any external modifications
-  fileWatcher.on('change', async () => {
+  const watcher = fileWatcher;
+  let changeTimer = null;
+
+  const onChatChange = async () => {
+    // Watcher was closed while the refresh was pending
+    if (fileWatcher !== watcher) return;
+
     try {
+      const { size, mtimeMs } = await fs.stat(chatPath);
+      // Our own appends were already pushed to the renderer via 'chat-message'
+      if (size === chatSelfWriteSize) return;
+      // Already read this version of the file
+      if (size === chatReadState.size && mtimeMs === chatReadState.mtimeMs) return;
+
       const messages = await getChatContent();
-      if (mainWindow) {
-        mainWindow.webContents.send('chat-updated', messages);
-      }
+      sendToRenderer('chat-updated', messages);
     } catch (error) {
       console.error('Error reading chat file:', error);
     }
+  };
+
+  // Fold bursts of change events into a single refresh
+  fileWatcher.on('change', () => {
+    clearTimeout(changeTimer);
+    changeTimer = setTimeout(onChatChange, FILE_CHANGE_DEBOUNCE_MS);
   });
 
   console.log('File watcher started for:', chatPath);
 }
 
+// Watch PLAN_FINAL.md and push its content to the renderer when it changes
+function startPlanWatcher() {
+  const planPath = path.join(workspacePath, config.plan_file || 'PLAN_FINAL.md');
+
+  planWatcher = chokidar.watch(planPath, {
+    persistent: true,
+    ignoreInitial: true
+  });
+
+  const watcher = planWatcher;
+  let changeTimer = null;
+
+  const onPlanChange = async () => {
+    // Watcher was closed while the refresh was pending
+    if (planWatcher !== watcher) return;
+
+    try {
+      const content = await getPlanContent();
+      sendToRenderer('plan-updated', content);
+    } catch (error) {
+      console.error('Error reading plan file:', error);
+    }
+  };
+
+  // Agents may write the plan in place or replace the file; a heredoc write
+  // truncates then writes, so fold the burst into one read of the final content
+  const schedulePlanChange = () => {
+    clearTimeout(changeTimer);
+    changeTimer = setTimeout(onPlanChange, FILE_CHANGE_DEBOUNCE_MS);
+  };
+  planWatcher.on('add', schedulePlanChange);
+  planWatcher.on('change', schedulePlanChange);
+  // A deleted plan reads back as empty, so the renderer clears it
+  planWatcher.on('unlink', schedulePlanChange);
+
+  console.log('Plan watcher started for:', planPath);
+}
+
 // Watch outbox directory and merge messages into chat.jsonl
 function startOutboxWatcher() {
   const outboxDir = path.join(workspacePath, config.outbox_dir || 'outbox');
-  const chatPath = path.join(workspacePath, config.chat_file || 'chat.jsonl');
 
   // Track which files we're currently processing to avoid race conditions
   const processing = new Set();
@@ -682,8 +774,9 @@ function startOutboxWatcher() {
     persistent: true,
     ignoreInitial: true,
     awaitWriteFinish: {
-      stabilityThreshold: 500,  // Wait for file to be stable for 500ms
-      pollInterval: 100
+      // Agents write their outbox with a single heredoc, so it settles quickly
+      stabilityThreshold: config.outbox_settle_ms || 250,
+      pollInterval: 50
     }
   });
 
@@ -723,7 +816,7 @@ function startOutboxWatcher() {
       };
 
       // Append to chat.jsonl
-      await fs.appendFile(chatPath, JSON.stringify(message) + '\n');
+      await appendChatMessage(message);
       console.log(`Merged message from ${agentName} (#${messageSequence}) into chat.jsonl`);
 
       // Clear the outbox file
@@ -733,9 +826,7 @@ function startOutboxWatcher() {
       sendMessageToOtherAgents(agentName, trimmedContent);
 
       // Notify renderer with the new message
-      if (mainWindow) {
-        mainWindow.webContents.send('chat-message', message);
-      }
+      sendToRenderer('chat-message', message);
 
     } catch (error) {
       console.error(`Error processing outbox file ${filePath}:`, error);
@@ -747,6 +838,61 @@ function startOutboxWatcher() {
   console.log('Outbox watcher started for:', outboxDir);
 }
 
+// Append a message to chat.jsonl. Appends are queued so concurrent writers
+// (outbox merges, user messages) never interleave and file order follows seq.
+function appendChatMessage(message) {
+  const line = Buffer.from(JSON.stringify(message) + '\n');
+  const result = chatAppendQueue.then(() => writeChatLine(line));
+  chatAppendQueue = result.catch(() => {});
+  return result;
+}
+
+// Write one encoded line through the append handle kept open for the session
+async function writeChatLine(line) {
+  const chatPath = path.join(workspacePath, config.chat_file || 'chat.jsonl');
+
+  try {
+    // File was deleted or replaced (e.g. editor save by rename, git clean) -
+    // reopen by path, otherwise writes land in the old, unlinked file
+    if (chatAppendHandle) {
+      const stats = await fs.stat(chatPath).catch(error => {
+        if (error.code === 'ENOENT') return null;
+        throw error;
+      });
+      if (!stats || stats.ino !== chatAppendHandle.ino) {
+        closeChatAppendHandle();
+      }
+    }
+
+    if (!chatAppendHandle) {
+      const handle = await fs.open(chatPath, 'a');
+      chatAppendHandle = { handle, ino: (await handle.stat()).ino };
+    }
+
+    const { handle } = chatAppendHandle;
+    // Opened with O_APPEND, so every write lands at the current end of file
+    let offset = 0;
+    while (offset < line.length) {
+      const { bytesWritten } = await handle.write(line, offset, line.length - offset);
+      offset += bytesWritten;
+    }
+    chatSelfWriteSize = (await handle.stat()).size;
+  } catch (error) {
+    // Drop the handle so the next append reopens the file
+    closeChatAppendHandle();
+    throw error;
+  }
+}
+
+// Close the chat.jsonl append handle
+function closeChatAppendHandle() {
+  chatSelfWriteSize = -1;
+  if (chatAppendHandle) {
+    chatAppendHandle.handle.close().catch(() => {});
+    chatAppendHandle = null;
+  }
+}
+
 // Stop outbox watcher
 function stopOutboxWatcher() {
   if (outboxWatcher) {
@@ -757,7 +903,6 @@ function stopOutboxWatcher() {
 
 // Append user message to chat.jsonl and push to all agents
 async function sendUserMessage(messageText) {
-  const chatPath = path.join(workspacePath, config.chat_file || 'chat.jsonl');
   messageSequence++;
   const timestamp = new Date().toISOString();
 
@@ -772,16 +917,14 @@ async function sendUserMessage(messageText) {
 
   try {
     // Append to chat.jsonl
-    await fs.appendFile(chatPath, JSON.stringify(message) + '\n');
+    await appendChatMessage(message);
     console.log(`User message #${messageSequence} appended to chat`);
 
     // PUSH message to all agents' PTYs
     sendMessageToAllAgents(messageText);
 
     // Notify renderer with the new message
-    if (mainWindow) {
-      mainWindow.webContents.send('chat-message', message);
-    }
+    sendToRenderer('chat-message', message);
 
   } catch (error) {
     console.error('Error appending user message:', error);
@@ -789,24 +932,108 @@ async function sendUserMessage(messageText) {
   }
 }
 
+// Fresh incremental reader state (offset, mtime, last bytes read, unterminated
+// trailing bytes, parsed messages)
+function createChatReadState() {
+  return {
+    size: 0,
+    mtimeMs: 0,
+    tail: Buffer.alloc(0),
+    pending: Buffer.alloc(0),
+    messages: []
+  };
+}
+
+function resetChatReadState() {
+  chatReadState = createChatReadState();
+}
+
+// Close the chat.jsonl read handle
+function closeChatReadHandle() {
+  if (chatReadHandle) {
+    chatReadHandle.handle.close().catch(() => {});
+    chatReadHandle = null;
+  }
+}
+
 // Read current chat content (returns array of message objects)
 async function getChatContent() {
+  const result = chatReadQueue.then(readChatDelta);
+  chatReadQueue = result.catch(() => {});
+  return result;
+}
+
+// Parse only what was appended to chat.jsonl since the last read
+async function readChatDelta() {
   const chatPath = path.join(workspacePath, config.chat_file || 'chat.jsonl');
   try {
-    const content = await fs.readFile(chatPath, 'utf8');
-    if (!content.trim()) return [];
+    const stats = await fs.stat(chatPath);
+
+    // Nothing changed since the last read - skip the read entirely
+    if (stats.size === chatReadState.size && stats.mtimeMs === chatReadState.mtimeMs) {
+      return chatReadState.messages;
+    }
+
+    // File was replaced by another file - reopen and start over
+    if (chatReadHandle && chatReadHandle.ino !== stats.ino) {
+      closeChatReadHandle();
+      resetChatReadState();
+    }
+
+    // File was truncated or rewritten in place (e.g. session reset) - start over
+    if (stats.size < chatReadState.size ||
+        (stats.size === chatReadState.size && stats.mtimeMs !== chatReadState.mtimeMs)) {
+      resetChatReadState();
+    }
+
+    // Read just the appended bytes (positional read, no seek or reopen), starting
+    // a few bytes early to re-read the end of what was already consumed
+    const tail = chatReadState.tail;
+    const length = stats.size - chatReadState.size;
+    const buffer = Buffer.alloc(tail.length + length);
+    let bytesRead = 0;
+    if (length > 0) {
+      if (!chatReadHandle) {
+        chatReadHandle = { handle: await fs.open(chatPath, 'r'), ino: stats.ino };
+      }
+      ({ bytesRead } = await chatReadHandle.handle.read(
+        buffer, 0, buffer.length, chatReadState.size - tail.length));
+
+      // Those bytes changed - the file was rewritten in place and grew, so the
+      // offset is stale. Start over (the tail is empty after a reset).
+      if (!buffer.subarray(0, tail.length).equals(tail)) {
+        resetChatReadState();
+        return readChatDelta();
+      }
+    }
+    const delta = buffer.subarray(tail.length, Math.max(tail.length, bytesRead));
+
+    chatReadState.size += delta.length;
+    chatReadState.mtimeMs = stats.mtimeMs;
+    chatReadState.tail = Buffer.from(
+      buffer.subarray(Math.max(0, tail.length + delta.length - CHAT_TAIL_CHECK_BYTES),
+        tail.length + delta.length));
+
+    // Only parse complete lines; keep a partially written trailing line for next time
+    const data = Buffer.concat([chatReadState.pending, delta]);
+    const lastNewline = data.lastIndexOf(0x0a);
+    if (lastNewline === -1) {
+      chatReadState.pending = data;
+      return chatReadState.messages;
+    }
+    chatReadState.pending = data.subarray(lastNewline + 1);
 
     // Parse JSONL (one JSON object per line)
-    const messages = content.trim().split('\n').map(line => {
+    for (const line of data.toString('utf8', 0, lastNewline).split('\n')) {
+      if (!line.trim()) continue;
       try {
-        return JSON.parse(line);
+        chatReadState.messages.push(JSON.parse(line));
       } catch (e) {
         console.error('Failed to parse chat line:', line);
-        return null;
       }
-    }).filter(Boolean);
+    }
 
-    return messages;
+    return chatReadState.messages;
   } catch (error) {
     console.error('Error reading chat:', error);
     return [];
@@ -824,7 +1051,8 @@ async function getPlanContent() {
 }
 
 // Get git diff - shows uncommitted changes only (git diff HEAD)
-async function getGitDiff() {
+// statsOnly skips the full patch (used for the badge while the diff tab is hidden)
+async function getGitDiff({ statsOnly = false } = {}) {
   // Not a git repo or session hasn't started
   if (!agentCwd) {
     return { isGitRepo: false, error: 'No session active' };
@@ -832,7 +1060,7 @@ async function getGitDiff() {
 
   // Check if git repo
   try {
-    await execAsync('git rev-parse --git-dir', { cwd: agentCwd });
+    await execFileAsync('git', ['rev-parse', '--git-dir'], { cwd: agentCwd });
   } catch (error) {
     return { isGitRepo: false, error: 'Not a git repository' };
   }
@@ -842,13 +1070,14 @@ async function getGitDiff() {
       isGitRepo: true,
       stats: { filesChanged: 0, insertions: 0, deletions: 0 },
       diff: '',
-      untracked: []
+      untracked: [],
+      statsOnly
     };
 
     // Check if HEAD exists (repo might have no commits)
     let hasHead = true;
     try {
-      await execAsync('git rev-parse HEAD', { cwd: agentCwd });
+      await execFileAsync('git', ['rev-parse', 'HEAD'], { cwd: agentCwd });
     } catch (e) {
       hasHead = false;
     }
@@ -858,12 +1087,12 @@ async function getGitDiff() {
 
     // Get diff stats
     try {
-      const { stdout: statOutput } = await execAsync(
-        `git diff ${diffTarget} --stat`,
-        { cwd: agentCwd, maxBuffer: 10 * 1024 * 1024 }
+      const { stdout: statOutput } = await execFileAsync(
+        'git', ['diff', diffTarget, '--shortstat'],
+        { cwd: agentCwd }
       );
 
-      // Parse stats from last line (e.g., "3 files changed, 10 insertions(+), 5 deletions(-)")
+      // Parse summary line (e.g., "3 files changed, 10 insertions(+), 5 deletions(-)")
       const statMatch = statOutput.match(/(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?/);
       if (statMatch) {
         result.stats.filesChanged = parseInt(statMatch[1]) || 0;
@@ -875,20 +1104,22 @@ async function getGitDiff() {
     }
 
     // Get full diff
-    try {
-      const { stdout: diffOutput } = await execAsync(
-        `git diff ${diffTarget}`,
-        { cwd: agentCwd, maxBuffer: 10 * 1024 * 1024 }
-      );
-      result.diff = diffOutput;
-    } catch (e) {
-      result.diff = '';
+    if (!statsOnly) {
+      try {
+        const { stdout: diffOutput } = await execFileAsync(
+          'git', ['diff', diffTarget],
+          { cwd: agentCwd, maxBuffer: 10 * 1024 * 1024 }
+        );
+        result.diff = diffOutput;
+      } catch (e) {
+        result.diff = '';
+      }
     }
 
     // Get untracked files
     try {
-      const { stdout: untrackedOutput } = await execAsync(
-        'git ls-files --others --exclude-standard',
+      const { stdout: untrackedOutput } = await execFileAsync(
+        'git', ['ls-files', '--others', '--exclude-standard'],
         { cwd: agentCwd }
       );
       result.untracked = untrackedOutput.trim().split('\n').filter(Boolean);
@@ -910,7 +1141,13 @@ function stopAllAgents() {
     fileWatcher.close();
     fileWatcher = null;
   }
+  if (planWatcher) {
+    planWatcher.close();
+    planWatcher = null;
+  }
   stopOutboxWatcher();
+  closeChatReadHandle();
+  closeChatAppendHandle();
 }
 
 // IPC Handlers
@@ -918,7 +1155,7 @@ ipcMain.handle('load-config', async () => {
   try {
     console.log('IPC: load-config called');
     await loadConfig(customConfigPath);
-    console.log('IPC: load-config returning:', config);
+    console.log(`IPC: load-config returning ${config.agents?.length || 0} agents`);
     return config;
   } catch (error) {
     console.error('IPC: load-config error:', error);
@@ -934,6 +1171,7 @@ ipcMain.handle('start-session', async (event, { challenge, workspace: selectedWo
     initializeAgents();
     await startAgents(challenge);
     startFileWatcher();
+    startPlanWatcher();
     startOutboxWatcher();  // Watch for agent messages and merge into chat.jsonl
 
     // Add workspace to recents (agentCwd is the project root)
@@ -981,8 +1219,8 @@ ipcMain.handle('get-plan-content', async () => {
   return await getPlanContent();
 });
 
-ipcMain.handle('get-git-diff', async () => {
-  return await getGitDiff();
+ipcMain.handle('get-git-diff', async (event, options) => {
+  return await getGitDiff(options);
 });
 
 ipcMain.handle('stop-agents', async () => {
@@ -1003,6 +1241,7 @@ ipcMain.handle('reset-session', async () => {
       } catch (e) {
         if (e.code !== 'ENOENT') throw e;
       }
+      resetChatReadState();
 
       // Clear plan file (handle missing file gracefully)
       const planPath = path.join(workspacePath, config.plan_file || 'PLAN_FINAL.md');
@@ -20,8 +20,8 @@ contextBridge.exposeInMainWorld('electronAPI', {
   // Get final plan content
   getPlanContent: () => ipcRenderer.invoke('get-plan-content'),
 
-  // Get git diff since session start
-  getGitDiff: () => ipcRenderer.invoke('get-git-diff'),
+  // Get git diff since session start (options.statsOnly skips the full patch)
+  getGitDiff: (options) => ipcRenderer.invoke('get-git-diff', options),
 
   // Stop all agents
   stopAgents: () => ipcRenderer.invoke('stop-agents'),
@@ -65,6 +65,11 @@ contextBridge.exposeInMainWorld('electronAPI', {
   // Listen for new chat messages (single message)
   onChatMessage: (callback) => {
     ipcRenderer.on('chat-message', (event, message) => callback(message));
+  },
+
+  // Listen for final plan changes (full plan content)
+  onPlanUpdated: (callback) => {
+    ipcRenderer.on('plan-updated', (event, content) => callback(content));
   }
 });
 
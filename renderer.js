@@ -3,10 +3,13 @@ let currentConfig = null;
 let agentData = {};
 let currentAgentTab = null;
 let terminals = {};
+let agentElements = {};  // Map of agent name -> { output, status, content, lockToggle } elements
 let agentColors = {};  // Map of agent name -> color
 let chatMessages = []; // Array of chat messages
+let chatSeqs = new Set();  // Sequence numbers present in chatMessages
 let inputLocked = {};  // Map of agent name -> boolean (default true)
 let planHasContent = false;  // Track if PLAN_FINAL has content
+let lastPlanContent = null;  // Last rendered PLAN_FINAL content (skip re-render when unchanged)
 let implementationStarted = false;  // Track if implementation has started
 let autoScrollEnabled = true;
 let currentMainTab = 'chat';  // Track which main tab is active ('chat', 'plan', or 'diff')
@@ -14,6 +17,9 @@ let lastDiffData = null;  // Cache last diff data
 let parsedDiffFiles = [];  // Parsed diff data per file
 let selectedDiffFile = null;  // Currently selected file in diff view (null = all)
 let pollingIntervals = [];  // Store interval IDs to clear on reset
+let chatPollTimeout = null;  // Pending fallback chat poll
+let chatPollDelay = 0;  // Current fallback chat poll delay (backs off while chat is idle)
+let chatPollingActive = false;
 
 // Workspace selection state
 let selectedWorkspace = null;  // Currently selected workspace path
@@ -22,6 +28,18 @@ let cliWorkspace = null;       // Workspace passed via CLI
 let cwdInfo = null;            // Current working directory info
 
 const CHAT_SCROLL_THRESHOLD = 40;
+// ANSI escape sequences (CSI, OSC, two-byte ESC), CR line endings and C0 control
+// characters other than newline and tab - compiled once and applied in a single
+// pass (CR/CRLF become newlines, everything else is removed)
+const CONTROL_SEQUENCE_PATTERN = /\x1b\[[0-?]*[ -\/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-_]|\r\n?|[\x00-\x08\x0b-\x1f\x7f]/g;
+// Any character the pattern above could match (ESC and CR included) - cheap pre-check
+const CONTROL_CHAR_PATTERN = /[\x00-\x08\x0b-\x1f\x7f]/;
+// Escape sequence (or CR of a CRLF) cut off at the end of a chunk - held back
+// until the next chunk completes it
+const INCOMPLETE_SEQUENCE_PATTERN = /(?:\x1b(?:\[[0-?]*[ -\/]*|\][^\x07\x1b]{0,512}\x1b?)?|\r)$/;
+const MAX_PLAIN_OUTPUT_CHARS = 1000000;  // Scrollback kept for non-PTY agent output
+const CHAT_POLL_MIN_MS = 2000;
+const CHAT_POLL_MAX_MS = 30000;
 const TAB_STORAGE_KEY = 'activeMainTab';
 
 // DOM Elements
@@ -86,13 +104,12 @@ async function initialize() {
   // Check if xterm is available
   console.log('Terminal available?', typeof Terminal !== 'undefined');
   console.log('FitAddon available?', typeof FitAddon !== 'undefined');
-  console.log('FitAddon object:', FitAddon);
   console.log('marked available?', typeof marked !== 'undefined');
 
   // Check if electronAPI is available
   if (!window.electronAPI) {
     console.error('electronAPI not available!');
-    configDetails.innerHTML = '<span style="color: #dc3545;">Error: Electron API not available</span>';
+    configDetails.innerHTML = '<span class="config-error">Error: Electron API not available</span>';
     return;
   }
 
@@ -101,14 +118,14 @@ async function initialize() {
   try {
     console.log('Loading config...');
     currentConfig = await window.electronAPI.loadConfig();
-    console.log('Config loaded:', currentConfig);
+    console.log('Config loaded');
     displayConfig();
 
     // Load workspace info
     await loadWorkspaceInfo();
   } catch (error) {
     console.error('Error loading config:', error);
-    configDetails.innerHTML = `<span style="color: #dc3545;">Error loading configuration: ${error.message}</span>`;
+    configDetails.innerHTML = `<span class="config-error">Error loading configuration: ${error.message}</span>`;
   }
 }
 
@@ -303,7 +320,7 @@ async function openConfigFolder() {
 // Display configuration info
 function displayConfig() {
   if (!currentConfig) {
-    configDetails.innerHTML = '<span style="color: #dc3545;">No configuration loaded</span>';
+    configDetails.innerHTML = '<span class="config-error">No configuration loaded</span>';
     return;
   }
 
@@ -344,6 +361,7 @@ async function startSession() {
       // Initialize agent data and colors
       agentColors = result.colors || {};
       chatMessages = []; // Reset chat messages
+      chatSeqs = new Set();
 
       result.agents.forEach(agent => {
         agentData[agent.name] = {
@@ -361,7 +379,7 @@ async function startSession() {
       // Setup UI
       workspacePath.textContent = result.workspace;
       if (result.fromCli) {
-        workspacePath.innerHTML = result.workspace + ' <span class="cli-badge" style="font-size: 10px; padding: 2px 6px; background: rgba(20, 241, 149, 0.15); color: var(--accent-primary); border-radius: 4px; margin-left: 8px;">(via CLI)</span>';
+        workspacePath.innerHTML = escapeHtml(result.workspace) + ' <span class="cli-badge">(via CLI)</span>';
       }
       createAgentTabs(result.agents);
       renderChatMessages(); // Initial render (empty)
@@ -383,6 +401,7 @@ async function startSession() {
 function createAgentTabs(agents) {
   agentTabsContainer.innerHTML = '';
   agentOutputsContainer.innerHTML = '';
+  agentElements = {};
 
   agents.forEach((agent, index) => {
     const agentInfo = agentData[agent.name];
@@ -413,6 +432,9 @@ function createAgentTabs(agents) {
     statusDiv.id = `status-${agent.name}`;
     outputDiv.appendChild(statusDiv);
 
+    const elements = { output: outputDiv, status: statusDiv, content: null, lockToggle: null };
+    agentElements[agent.name] = elements;
+
     if (agentInfo && agentInfo.use_pty) {
       // Create xterm terminal for PTY agents
       const terminalDiv = document.createElement('div');
@@ -452,6 +474,7 @@ function createAgentTabs(agents) {
       lockToggle.innerHTML = '🔒 Input locked';
       lockToggle.onclick = () => toggleInputLock(agent.name);
       terminalDiv.appendChild(lockToggle);
+      elements.lockToggle = lockToggle;
 
       // Wire terminal input to PTY (only when unlocked)
       terminal.onData((data) => {
@@ -471,6 +494,7 @@ function createAgentTabs(agents) {
       const contentPre = document.createElement('pre');
       contentPre.id = `content-${agent.name}`;
       outputDiv.appendChild(contentPre);
+      elements.content = contentPre;
     }
 
     agentOutputsContainer.appendChild(outputDiv);
@@ -509,8 +533,10 @@ function switchAgentTab(agentName) {
 
 // Toggle input lock for a terminal
 function toggleInputLock(agentName) {
+  // Only PTY agents have a lock toggle - leave the lock state alone for others
+  const toggle = agentElements[agentName]?.lockToggle;
+  if (!toggle) return;
   inputLocked[agentName] = !inputLocked[agentName];
-  const toggle = document.querySelector(`#terminal-${agentName} .input-lock-toggle`);
   const terminal = terminals[agentName]?.terminal;
 
   if (inputLocked[agentName]) {
@@ -536,40 +562,97 @@ function toggleInputLock(agentName) {
 
 // Update agent output
 function updateAgentOutput(agentName, output, isPty) {
-  if (!agentData[agentName]) {
-    agentData[agentName] = { name: agentName, output: [] };
+  // Runs for every output chunk - look each agent entry up once
+  let agent = agentData[agentName];
+  if (!agent) {
+    agent = agentData[agentName] = { name: agentName, output: [] };
   }
 
-  agentData[agentName].output.push(output);
-
   // Check if this agent uses PTY/terminal
-  if (isPty && terminals[agentName]) {
-    // Write directly to xterm terminal
-    terminals[agentName].terminal.write(output);
+  const term = isPty && terminals[agentName];
+  if (term) {
+    // Write directly to xterm terminal (it keeps its own scrollback)
+    term.terminal.write(output);
   } else {
-    // Use regular text output
-    const contentElement = document.getElementById(`content-${agentName}`);
-    if (contentElement) {
-      contentElement.textContent = agentData[agentName].output.join('');
+    // Use regular text output (no terminal to interpret escape sequences)
+    let text = stripControlSequences(output, agent);
+    if (!text) return;
+    // A batch is whatever the agent printed in one flush interval, so it can be
+    // any size - bound the scrollback by characters, not chunks
+    if (text.length > MAX_PLAIN_OUTPUT_CHARS) {
+      text = text.slice(-MAX_PLAIN_OUTPUT_CHARS);
+    }
+    agent.output.push(text);
+    agent.outputChars = (agent.outputChars || 0) + text.length;
+    // Keep scrollback bounded - drop the oldest chunks by advancing the start
+    // index, so a full scrollback doesn't shift the whole array on every chunk
+    const start = agent.outputStart || 0;
+    let dropped = 0;
+    while (agent.outputChars > MAX_PLAIN_OUTPUT_CHARS) {
+      agent.outputChars -= agent.output[start + dropped].length;
+      dropped++;
+    }
+    agent.outputStart = start + dropped;
+    // Compact once the dropped prefix outgrows the live scrollback
+    if (agent.outputStart > agent.output.length / 2) {
+      agent.output = agent.output.slice(agent.outputStart);
+      agent.outputStart = 0;
+    }
+    const elements = agentElements[agentName];
+    if (elements && elements.content) {
+      const content = elements.content;
+      const kept = agent.output.length - agent.outputStart;
+      // The <pre> holds one text node per stored chunk: append the new chunk and
+      // remove dropped ones instead of re-joining the whole scrollback
+      if (content.childNodes.length === kept - 1 + dropped) {
+        for (let i = 0; i < dropped; i++) {
+          content.firstChild.remove();
+        }
+        content.append(text);
+      } else {
+        // Build the nodes in a fragment - the live scrollback can hold far more
+        // chunks than a spread call accepts as arguments
+        const fragment = document.createDocumentFragment();
+        for (let i = agent.outputStart; i < agent.output.length; i++) {
+          fragment.append(agent.output[i]);
+        }
+        content.replaceChildren(fragment);
+      }
 
       // Auto-scroll if this is the active tab
       if (currentAgentTab === agentName) {
-        const outputContainer = document.getElementById(`output-${agentName}`);
-        if (outputContainer) {
-          outputContainer.scrollTop = outputContainer.scrollHeight;
-        }
+        elements.output.scrollTop = elements.output.scrollHeight;
       }
     }
   }
 }
 
+// Remove terminal escape sequences and control characters from plain-text output.
+// A sequence split across chunks is carried over on the agent (agent.outputTail).
+function stripControlSequences(text, agent) {
+  if (agent.outputTail) {
+    text = agent.outputTail + text;
+    agent.outputTail = '';
+  }
+  // Most plain-pipe output has nothing to strip - skip the full pattern and the copy
+  if (!CONTROL_CHAR_PATTERN.test(text)) {
+    return text;
+  }
+  const incomplete = INCOMPLETE_SEQUENCE_PATTERN.exec(text);
+  if (incomplete) {
+    agent.outputTail = incomplete[0];
+    text = text.slice(0, incomplete.index);
+  }
+  return text.replace(CONTROL_SEQUENCE_PATTERN, match => match[0] === '\r' ? '\n' : '');
+}
+
 // Update agent status
 function updateAgentStatus(agentName, status, exitCode = null, error = null) {
   if (agentData[agentName]) {
     agentData[agentName].status = status;
   }
 
-  const statusElement = document.getElementById(`status-${agentName}`);
+  const statusElement = agentElements[agentName]?.status;
   if (statusElement) {
     statusElement.className = `agent-status ${status}`;
 
@@ -583,10 +666,12 @@ function updateAgentStatus(agentName, status, exitCode = null, error = null) {
   }
 }
 
+// Shared formatter - toLocaleTimeString builds a new one on every call
+const timestampFormatter = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+
 // Format timestamp for display
 function formatTimestamp(isoString) {
-  const date = new Date(isoString);
-  return date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+  return timestampFormatter.format(new Date(isoString));
 }
 
 // Render a single chat message as HTML
@@ -625,18 +710,36 @@ function renderChatMessages() {
   }
 }
 
+// Render messages after the ones already shown, leaving existing markup untouched
+function appendChatMessages(messages) {
+  chatViewer.insertAdjacentHTML('beforeend', messages.map(renderChatMessage).join(''));
+  if (autoScrollEnabled) {
+    scrollChatToBottom();
+  }
+}
+
 // Add a new message to chat
 function addChatMessage(message) {
   // Check if message already exists (by sequence number)
-  const exists = chatMessages.some(m => m.seq === message.seq);
-  if (!exists) {
-    const shouldScroll = autoScrollEnabled;
-    chatMessages.push(message);
-    chatMessages.sort((a, b) => a.seq - b.seq); // Ensure order
+  if (chatSeqs.has(message.seq)) {
+    return;
+  }
+
+  const shouldScroll = autoScrollEnabled;
+  const lastMessage = chatMessages[chatMessages.length - 1];
+  chatSeqs.add(message.seq);
+  chatMessages.push(message);
+  // Messages normally arrive in order and are appended; only re-render all when one didn't
+  if (lastMessage && lastMessage.seq > message.seq) {
+    chatMessages.sort((a, b) => a.seq - b.seq);
     renderChatMessages();
-    if (!shouldScroll) {
-      setNewMessagesBanner(true);
-    }
+  } else if (lastMessage) {
+    appendChatMessages([message]);
+  } else {
+    renderChatMessages();  // Replaces the empty placeholder
+  }
+  if (!shouldScroll) {
+    setNewMessagesBanner(true);
   }
 }
 
@@ -651,8 +754,19 @@ function updateChatFromMessages(messages) {
     }
 
     const shouldScroll = autoScrollEnabled;
+    const prevCount = chatMessages.length;
+    // New array only extends what is shown - render just the new tail
+    const isExtension = prevCount > 0 &&
+      messages.length > prevCount &&
+      messages[prevCount - 1].seq === prevLastSeq;
+
     chatMessages = messages;
-    renderChatMessages();
+    chatSeqs = new Set(messages.map(m => m.seq));
+    if (isExtension) {
+      appendChatMessages(messages.slice(prevCount));
+    } else {
+      renderChatMessages();
+    }
     if (!shouldScroll) {
       setNewMessagesBanner(true);
     }
@@ -692,23 +806,32 @@ async function sendUserMessage() {
 async function refreshPlan() {
   try {
     const content = await window.electronAPI.getPlanContent();
-
-    if (content.trim()) {
-      const htmlContent = marked.parse(content);
-      planViewer.innerHTML = `<div class="markdown-content">${htmlContent}</div>`;
-      planHasContent = true;
-    } else {
-      planViewer.innerHTML = '<em>No plan yet...</em>';
-      planHasContent = false;
-    }
-
-    // Update button visibility
-    updateImplementButtonState();
+    renderPlan(content);
   } catch (error) {
     console.error('Error refreshing plan:', error);
   }
 }
 
+// Render plan content and update button visibility
+function renderPlan(content) {
+  if (content === lastPlanContent) {
+    return;
+  }
+  lastPlanContent = content;
+
+  if (content.trim()) {
+    const htmlContent = marked.parse(content);
+    planViewer.innerHTML = `<div class="markdown-content">${htmlContent}</div>`;
+    planHasContent = true;
+  } else {
+    planViewer.innerHTML = '<em>No plan yet...</em>';
+    planHasContent = false;
+  }
+
+  // Update button visibility
+  updateImplementButtonState();
+}
+
 // Update the Start Implementing button state
 function updateImplementButtonState() {
   if (implementationStarted) {
@@ -804,8 +927,7 @@ function parseDiffIntoFiles(diffText) {
       }
 
       // Extract filename from diff header
-      const match = line.match(/diff --git a\/(.+?) b\/(.+)/);
-      const filename = match ? match[2] : 'unknown';
+      const filename = parseDiffHeaderFilename(line);
 
       currentFile = {
         filename,
@@ -834,6 +956,16 @@ function parseDiffIntoFiles(diffText) {
   return files;
 }
 
+// Get the b/ path from a 'diff --git a/<old> b/<new>' header without regex backtracking
+const DIFF_HEADER_PREFIX = 'diff --git a/';
+function parseDiffHeaderFilename(line) {
+  if (!line.startsWith(DIFF_HEADER_PREFIX)) return 'unknown';
+  // Old path is at least one character long
+  const separator = line.indexOf(' b/', DIFF_HEADER_PREFIX.length + 1);
+  if (separator === -1 || separator + 3 >= line.length) return 'unknown';
+  return line.slice(separator + 3);
+}
+
 // Render file list in diff view
 function renderDiffFileList(files, untracked) {
   if (!diffFileListItems) return;
@@ -865,7 +997,7 @@ function renderDiffFileList(files, untracked) {
   }
 
   if (files.length === 0 && (!untracked || untracked.length === 0)) {
-    html = '<li class="file-list-item no-changes" style="color: var(--text-dim); cursor: default;">No changes</li>';
+    html = '<li class="file-list-item no-changes">No changes</li>';
   }
 
   diffFileListItems.innerHTML = html;
@@ -964,16 +1096,26 @@ function renderGitDiff(data) {
 function formatDiffOutput(diff) {
   return diff.split('\n').map(line => {
     const escaped = escapeHtml(line);
-    if (line.startsWith('+++') || line.startsWith('---')) {
-      return `<span class="diff-file-header">${escaped}</span>`;
-    } else if (line.startsWith('@@')) {
-      return `<span class="diff-hunk-header">${escaped}</span>`;
-    } else if (line.startsWith('+')) {
-      return `<span class="diff-added">${escaped}</span>`;
-    } else if (line.startsWith('-')) {
-      return `<span class="diff-removed">${escaped}</span>`;
-    } else if (line.startsWith('diff --git')) {
-      return `<span class="diff-file-separator">${escaped}</span>`;
+    // Dispatch on the first character - context lines need a single comparison
+    switch (line[0]) {
+      case '+':
+        return line.startsWith('+++')
+          ? `<span class="diff-file-header">${escaped}</span>`
+          : `<span class="diff-added">${escaped}</span>`;
+      case '-':
+        return line.startsWith('---')
+          ? `<span class="diff-file-header">${escaped}</span>`
+          : `<span class="diff-removed">${escaped}</span>`;
+      case '@':
+        if (line.startsWith('@@')) {
+          return `<span class="diff-hunk-header">${escaped}</span>`;
+        }
+        break;
+      case 'd':
+        if (line.startsWith('diff --git')) {
+          return `<span class="diff-file-separator">${escaped}</span>`;
+        }
+        break;
     }
     return escaped;
   }).join('\n');
@@ -1067,6 +1209,48 @@ async function startImplementation() {
 function stopChatPolling() {
   pollingIntervals.forEach(id => clearInterval(id));
   pollingIntervals = [];
+
+  chatPollingActive = false;
+  clearTimeout(chatPollTimeout);
+  chatPollTimeout = null;
+}
+
+function scheduleChatPoll() {
+  clearTimeout(chatPollTimeout);
+  chatPollTimeout = setTimeout(pollChat, chatPollDelay);
+}
+
+// Poll chat content, backing off while no new messages turn up
+async function pollChat() {
+  chatPollTimeout = null;
+  try {
+    const prevCount = chatMessages.length;
+    const messages = await window.electronAPI.getChatContent();
+    if (messages && messages.length > 0) {
+      updateChatFromMessages(messages);
+    }
+    chatPollDelay = chatMessages.length !== prevCount
+      ? CHAT_POLL_MIN_MS
+      : Math.min(chatPollDelay * 2, CHAT_POLL_MAX_MS);
+  } catch (error) {
+    console.error('Error polling chat:', error);
+  }
+
+  if (chatPollingActive) {
+    scheduleChatPoll();
+  }
+}
+
+// Chat activity seen - go back to polling at the fast rate
+function resetChatPollBackoff() {
+  if (!chatPollingActive || chatPollDelay === CHAT_POLL_MIN_MS) {
+    return;
+  }
+  chatPollDelay = CHAT_POLL_MIN_MS;
+  // A poll in flight reschedules itself with the new delay
+  if (chatPollTimeout) {
+    scheduleChatPoll();
+  }
 }
 
 // Start polling chat content (fallback if file watcher has issues)
@@ -1074,29 +1258,22 @@ function startChatPolling() {
   // Clear any existing intervals first
   stopChatPolling();
 
-  pollingIntervals.push(setInterval(async () => {
-    try {
-      const messages = await window.electronAPI.getChatContent();
-      if (messages && messages.length > 0) {
-        updateChatFromMessages(messages);
-      }
-    } catch (error) {
-      console.error('Error polling chat:', error);
-    }
-  }, 2000));
-
-  // Also poll plan
-  pollingIntervals.push(setInterval(refreshPlan, 3000));
+  chatPollingActive = true;
+  chatPollDelay = CHAT_POLL_MIN_MS;
+  scheduleChatPoll();
 
   // Poll for diff updates (also updates badge even when not on diff tab)
   pollingIntervals.push(setInterval(async () => {
     try {
-      const data = await window.electronAPI.getGitDiff();
-      lastDiffData = data;
+      // The full patch is only needed while the diff tab is visible
+      const data = await window.electronAPI.getGitDiff({ statsOnly: currentMainTab !== 'diff' });
       updateDiffBadge(data);
-      // Only re-render if diff tab is active
-      if (currentMainTab === 'diff') {
-        renderGitDiff(data);
+      // Only keep and re-render full results (the tab may have changed while waiting)
+      if (!data.statsOnly) {
+        lastDiffData = data;
+        if (currentMainTab === 'diff') {
+          renderGitDiff(data);
+        }
       }
     } catch (error) {
       console.error('Error polling git diff:', error);
@@ -1124,7 +1301,9 @@ async function startNewSession() {
 
     // Reset UI state
     chatMessages = [];
+    chatSeqs = new Set();
     planHasContent = false;
+    lastPlanContent = null;
     implementationStarted = false;
     agentData = {};
     currentAgentTab = null;
@@ -1142,6 +1321,7 @@ async function startNewSession() {
       }
     });
     terminals = {};
+    agentElements = {};
 
     // Clear input
     challengeInput.value = '';
@@ -1189,11 +1369,11 @@ async function startNewSession() {
   }
 }
 
-// Utility: Escape HTML
+// Utility: Escape HTML (reuses one detached element instead of creating one per call)
+const escapeElement = document.createElement('div');
 function escapeHtml(text) {
-  const div = document.createElement('div');
-  div.textContent = text;
-  return div.innerHTML;
+  escapeElement.textContent = text;
+  return escapeElement.innerHTML;
 }
 
 function isChatNearBottom() {
@@ -1607,11 +1787,18 @@ window.electronAPI.onAgentStatus((data) => {
 // Listen for full chat refresh (array of messages)
 window.electronAPI.onChatUpdated((messages) => {
   updateChatFromMessages(messages);
+  resetChatPollBackoff();
 });
 
 // Listen for new individual messages
 window.electronAPI.onChatMessage((message) => {
   addChatMessage(message);
+  resetChatPollBackoff();
+});
+
+// Listen for plan changes (pushed by the plan file watcher)
+window.electronAPI.onPlanUpdated((content) => {
+  renderPlan(content);
 });
 
 // Initialize on load